@@ -38,6 +38,8 @@ class ButtonsFrame(ttk.Frame):
         self.height = height
         self.width = width
         self.data = DataStore.get_instance()
+        # Parse the config file once for all the button callbacks
+        self.config_util = ConfigUtil("config/config.ini")
         self.render_dir = None
         self.create_widgets()
 
@@ -426,7 +428,7 @@ class ButtonsFrame(ttk.Frame):
         """
         Method to load config data of the COVID-19 virus
         """
-        config_util = ConfigUtil("config/config.ini")
+        config_util = self.config_util
 
         self.data.k_val.set(str(config_util.getFloatValue("covid.stats",
                                                           "k_value")))
@@ -471,7 +473,7 @@ class ButtonsFrame(ttk.Frame):
         """
         Method to load config data of the influenza virus
         """
-        config_util = ConfigUtil("config/config.ini")
+        config_util = self.config_util
 
         self.data.k_val \
             .set(str(config_util.getFloatValue("influenza.stats", "k_value")))
@@ -519,7 +521,7 @@ class ButtonsFrame(ttk.Frame):
         generates the video file of the simulation in render mode;
         """
 
-        config_util = ConfigUtil("config/config.ini")
+        config_util = self.config_util
         if self.data.render_dir is None and self.simulation_mode.get() == 1:
             self.start_sim_button["text"] = "Please select a directory"
             return
@@ -11,6 +11,18 @@ class Movement():
     Class providing abstraction into each movement of the population
     """
 
+    def __init__(self, seed: int = None) -> None:
+        """
+        Constructor to initialize the random generator deciding the
+        movements.
+
+        Parameters
+        ----------
+        seed : int, optional
+            Seed for the random generator, a fresh one is used if not given.
+        """
+        self.rng = np.random.default_rng(seed)
+
     def update_persons(self, persons: np.ndarray, size: int,
                        speed: float = 0.1,
                        heading_update_chance: float = 0.02) -> np.ndarray:
@@ -39,31 +51,26 @@ class Movement():
 
         # For updating the x position
         # Generate a random array with update chance for each person in
-        # the population
-        update = np.random.random(size=(size,))
-
-        # Get the persons in the population who have a lower or equal to
-        # chance of getting updated in this epoch
-        shp = update[update <= heading_update_chance].shape
+        # the population, and get the persons in the population who have a
+        # lower or equal to chance of getting updated in this epoch
+        update = self.rng.random(size=(size,)) <= heading_update_chance
 
         # Update the position for the direction in which they are heading
-        persons[:, idx.x_dir][update <= heading_update_chance] = np.random \
-            .normal(loc=0, scale=1/3, size=shp)
+        persons[update, idx.x_dir] = self.rng \
+            .normal(loc=0, scale=1/3, size=np.count_nonzero(update))
 
         # For updating the y position, do the same
-        update = np.random.random(size=(size,))
-        shp = update[update <= heading_update_chance].shape
-        persons[:, idx.y_dir][update <= heading_update_chance] = np.random \
-            .normal(loc=0, scale=1/3, size=shp)
+        update = self.rng.random(size=(size,)) <= heading_update_chance
+        persons[update, idx.y_dir] = self.rng \
+            .normal(loc=0, scale=1/3, size=np.count_nonzero(update))
 
         # Update the speed by generating a random normal distribution using
         # the argument speed as the parameter
-        update = np.random.random(size=(size,))
-        shp = update[update <= heading_update_chance].shape
-        persons[:, idx.speed][update <= heading_update_chance] = np.random \
-            .normal(loc=speed, scale=speed / 3, size=shp)
-        persons[:, idx.speed] = np.clip(persons[:, idx.speed], a_min=0.0005,
-                                        a_max=0.01)
+        update = self.rng.random(size=(size,)) <= heading_update_chance
+        persons[update, idx.speed] = self.rng \
+            .normal(loc=speed, scale=speed / 3, size=np.count_nonzero(update))
+        np.clip(persons[:, idx.speed], a_min=0.0005, a_max=0.01,
+                out=persons[:, idx.speed])
 
         # Return the updated array
         return persons
@@ -89,46 +96,40 @@ class Movement():
             The upated NumPy array with updated values
         """
 
-        # Store shape of list of people who are heading out of bounds based
-        # on X bound [0]
-        shp = persons[:, 4][(persons[:, 2] <= xbounds[:, 0]) &
-                            (persons[:, 4] < 0)].shape
-        # Update them randomly using a normal distribution
-        persons[:, 4][(persons[:, 2] <= xbounds[:, 0]) &
-                      (persons[:, 4] < 0)] = \
-            np.clip(np.random.normal(loc=0.5, scale=0.5/3, size=shp),
-                    a_min=0.05, a_max=1)
-
-        # Store shape of list of people who are heading out of bounds based
-        # on X bound [1]
-        shp = persons[:, 4][(persons[:, 2] >= xbounds[:, 1]) &
-                            (persons[:, 4] > 0)].shape
+        # Column views of the positions and directions, shared by all the
+        # checks below
+        x_axis = persons[:, idx.x_axis]
+        y_axis = persons[:, idx.y_axis]
+        x_dir = persons[:, idx.x_dir]
+        y_dir = persons[:, idx.y_dir]
+
+        # Get the people who are heading out of bounds based on X bound [0]
+        out = (x_axis <= xbounds[:, 0]) & (x_dir < 0)
         # Update them randomly using a normal distribution
-        persons[:, 4][(persons[:, 2] >= xbounds[:, 1]) &
-                      (persons[:, 4] > 0)] = \
-            np.clip(-np.random.normal(loc=0.5, scale=0.5/3, size=shp),
-                    a_min=-1, a_max=-0.05)
+        x_dir[out] = np.clip(self.rng.normal(loc=0.5, scale=0.5/3,
+                                             size=np.count_nonzero(out)),
+                             a_min=0.05, a_max=1)
 
-        # Store shape of list of people who are heading out of bounds based
-        # on Y bound [0]
-        shp = persons[:, 5][(persons[:, 3] <= ybounds[:, 0]) &
-                            (persons[:, 5] < 0)].shape
+        # Get the people who are heading out of bounds based on X bound [1]
+        out = (x_axis >= xbounds[:, 1]) & (x_dir > 0)
+        # Update them randomly using a normal distribution
+        x_dir[out] = np.clip(-self.rng.normal(loc=0.5, scale=0.5/3,
+                                              size=np.count_nonzero(out)),
+                             a_min=-1, a_max=-0.05)
 
+        # Get the people who are heading out of bounds based on Y bound [0]
+        out = (y_axis <= ybounds[:, 0]) & (y_dir < 0)
         # Update them randomly using a normal distribution
-        persons[:, 5][(persons[:, 3] <= ybounds[:, 0]) &
-                      (persons[:, 5] < 0)] = \
-            np.clip(np.random.normal(loc=0.5, scale=0.5/3, size=shp),
-                    a_min=0.05, a_max=1)
-
-        # Store shape of list of people who are heading out of bounds based
-        # on Y bound [1]
-        shp = persons[:, 5][(persons[:, 3] >= ybounds[:, 1]) &
-                            (persons[:, 5] > 0)].shape
+        y_dir[out] = np.clip(self.rng.normal(loc=0.5, scale=0.5/3,
+                                             size=np.count_nonzero(out)),
+                             a_min=0.05, a_max=1)
+
+        # Get the people who are heading out of bounds based on Y bound [1]
+        out = (y_axis >= ybounds[:, 1]) & (y_dir > 0)
         # Update them randomly using a normal distribution
-        persons[:, 5][(persons[:, 3] >= ybounds[:, 1]) &
-                      (persons[:, 5] > 0)] = \
-            np.clip(-np.random.normal(loc=0.5, scale=0.5/3, size=shp),
-                    a_min=-1, a_max=-0.05)
+        y_dir[out] = np.clip(-self.rng.normal(loc=0.5, scale=0.5/3,
+                                              size=np.count_nonzero(out)),
+                             a_min=-1, a_max=-0.05)
 
         return persons
 
@@ -148,14 +149,13 @@ class Movement():
         np.ndarray
             The upated NumPy array with updated values
         """
-        filter = (persons[:, idx.current_state] != 3) & \
-                 (persons[:, idx.social_distance] == 0)
+        moving = np.flatnonzero((persons[:, idx.current_state] != 3) &
+                                (persons[:, idx.social_distance] == 0))
+        speed = persons[moving, idx.speed]
 
         # x
-        persons[:, 2][filter] = persons[:, 2][filter] + \
-            (persons[:, 4][filter] * persons[:, 6][filter])
+        persons[moving, idx.x_axis] += persons[moving, idx.x_dir] * speed
         # y
-        persons[:, 3][filter] = persons[:, 3][filter] + \
-            (persons[:, 5][filter] * persons[:, 6][filter])
+        persons[moving, idx.y_axis] += persons[moving, idx.y_dir] * speed
 
         return persons
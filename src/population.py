@@ -11,7 +11,7 @@ class Population(object):
     properties and the dataframe holding all persons
     """
 
-    def __init__(self, size: int) -> None:
+    def __init__(self, size: int, seed: int = None) -> None:
         """
         Initializes the NumPy array holding all persons with their specific
         properties.
@@ -74,11 +74,25 @@ class Population(object):
                                         socially distance.
         19 - infected_by                The person this person was infected by
                                         if infected at all.
+
+        Parameters
+        ----------
+
+        :param size: Size of the population.
+        :param seed: Seed for the random generator used by all the
+                     initializers, a fresh one is used if not given.
         """
 
         # Generate the numpy array of population size = size and column
-        # size = 12
-        self.persons = np.zeros((size, 20))
+        # size = 20. The array is stored column-major (Fortran order) so that
+        # every property column, e.g. persons[:, 2], is contiguous in memory;
+        # the per-frame filters only ever scan a few columns at a time.
+        # Every property is either a small integer or a value bounded by the
+        # unit space, so single precision is enough and halves the memory
+        # each scan has to read.
+        self.persons = np.zeros((size, 20), dtype=np.float32, order='F')
+
+        self.rng = np.random.default_rng(seed)
 
     def set_age(self, data: list) -> None:
         """
@@ -117,7 +131,7 @@ class Population(object):
                      the population.
         :return:
         """
-        self.persons[:, 8] = data
+        self.persons[:, 9] = data
 
     def set_y_axis(self, data: list) -> None:
         """
@@ -297,6 +311,19 @@ class Population(object):
         """
         return self.persons[self.persons[:, 9] == 1]
 
+    def get_infected_idx(self) -> np.ndarray:
+        """
+        Returns the row index for all infected individuals in the population
+        without copying their rows.
+
+        Parameters
+        ----------
+
+        :return Returns the NumPy array containing the index of all persons in
+                the population who are infected.
+        """
+        return np.flatnonzero(self.persons[:, 9] == 1)
+
     def get_all_healthy(self) -> list:
         """
         Returns the index for all healthy individuals in the population
@@ -375,6 +402,39 @@ class Population(object):
         return self \
             .persons[(current_frame - self.persons[:, 16] > recovery_time)]
 
+    def rebuild_grid(self, cell: float) -> None:
+        """
+        Buckets every person into a uniform grid of square cells laid over
+        the unit space, so that people near a given person can be looked up
+        without scanning the whole population. People slightly out of bounds
+        are kept in the border cells.
+
+        Parameters
+        ----------
+
+        :param cell: Minimum side length of a single grid cell. The grid
+                     never has more cells than people, so smaller cells
+                     are widened, which still keeps everyone within one
+                     cell of their neighbours.
+        """
+        self.grid_width = max(int(np.ceil(np.sqrt(len(self.persons)))), 1)
+        if cell > 0 and 1 / cell < self.grid_width:
+            self.grid_width = max(int(np.ceil(1 / cell)), 1)
+        else:
+            cell = 1 / self.grid_width
+        cell_x = np.clip((self.persons[:, 2] / cell).astype(np.int32), 0,
+                         self.grid_width - 1)
+        cell_y = np.clip((self.persons[:, 3] / cell).astype(np.int32), 0,
+                         self.grid_width - 1)
+        self.grid_cell = cell_y * self.grid_width + cell_x
+
+        # Index of the persons ordered by their cell, and the offset of
+        # every cell in that ordering.
+        self.grid_order = np.argsort(self.grid_cell, kind='stable')
+        self.grid_cell_start = np.searchsorted(
+            self.grid_cell[self.grid_order],
+            np.arange(self.grid_width * self.grid_width + 1))
+
     def initialize_id(self, low: int, high: int) -> None:
         """
         Initialize the ID for all the individuals in the population
@@ -385,8 +445,7 @@ class Population(object):
         :param low: Lower bound for ID.
         :param high: Upper bound for ID.
         """
-        ID = list(range(low, high))
-        self.persons[:, 0] = ID
+        self.persons[:, 0] = np.arange(low, high)
 
     def initialize_ages(self, min_age: int, max_age: int,
                         size: int) -> None:
@@ -401,8 +460,8 @@ class Population(object):
         :param max_age: Maximum age for the randomly generated ages.
         :param size: Size of the population.
         """
-        ages = np.int32(np.random.uniform(low=min_age, high=max_age,
-                                          size=size))
+        ages = np.int32(self.rng.uniform(low=min_age, high=max_age,
+                                         size=size))
         self.set_age(ages)
 
     def initialize_positions(self, x_bounds: list, y_bounds: list,
@@ -419,10 +478,10 @@ class Population(object):
                          y axis.
         :param size: Size of the population.
         """
-        x_bound_list = np.random.uniform(low=x_bounds[0],
-                                         high=x_bounds[1], size=size)
-        y_bound_list = np.random.uniform(low=y_bounds[0],
-                                         high=y_bounds[1], size=size)
+        x_bound_list = self.rng.uniform(low=x_bounds[0],
+                                        high=x_bounds[1], size=size)
+        y_bound_list = self.rng.uniform(low=y_bounds[0],
+                                        high=y_bounds[1], size=size)
         self.set_x_axis(x_bound_list)
         self.set_y_axis(y_bound_list)
 
@@ -441,8 +500,8 @@ class Population(object):
                         randomly.
         :param size: Size of the random g value array to be generated.
         """
-        g_value = np.random.normal(loc=mean, scale=std_dev, size=size)
-        g_value[g_value < 0] = 0.00000
+        g_value = self.rng.normal(loc=mean, scale=std_dev, size=size)
+        np.maximum(g_value, 0, out=g_value)
         self.set_g_value(g_value.astype(int))
 
     def initialize_mask_eff(self, size: int,
@@ -458,14 +517,11 @@ class Population(object):
         :return:
         """
 
-        tmp = np.random.randint(low=0, high=len(mask_effective_range.keys()),
-                                size=size)
-        key_list = list(mask_effective_range.keys())
-
-        for i in range(len(key_list)):
-            tmp[tmp == i] = float(mask_effective_range[key_list[i]])
-
-        self.set_mask_effectiveness(tmp)
+        mask_category = self.rng \
+            .integers(low=0, high=len(mask_effective_range.keys()), size=size)
+        mask_values = np.array([float(value) for value in
+                                mask_effective_range.values()])
+        self.set_mask_effectiveness(mask_values[mask_category])
 
     def initialize_susceptibility(self) -> None:
         """
@@ -481,10 +537,7 @@ class Population(object):
                                       generated randomly.
         :param size: Size of the random g value array to be generated.
         """
-        tmp = (np.array([100] * len(self.persons)) - self.persons[:, 15]) / 100
-        tmp2 = [0.06] * len(self.persons)
-        tmp2 = np.multiply(tmp, tmp2)
-        self.persons[:, 13] = tmp2
+        self.persons[:, 13] = 0.06 * (100 - self.persons[:, 15]) / 100
 
     def initialize_mortality_rate(self, size: int,
                                   fatality_rate: dict) -> None:
@@ -518,9 +571,9 @@ class Population(object):
         :param fatality_rate: Fatality rate risk according to the age group
         """
         choice = [0, 1]
-        random_social_distancing = np.random.choice(choice, len(self.persons),
-                                                    p=[1-social_distancing_per,
-                                                    social_distancing_per])
+        random_social_distancing = self.rng.choice(choice, len(self.persons),
+                                                   p=[1-social_distancing_per,
+                                                   social_distancing_per])
         self.persons[:, 18] = random_social_distancing
 
     def initialize_infected_by(self) -> None:
@@ -19,7 +19,7 @@ class PopulationUtil(object):
                  infection_range: float, recovery_time: int,
                  total_healthcare_capacity: int, mask_effectiveness: dict,
                  speed: float, social_distancing_at: int,
-                 mask_wearing_at: int) -> None:
+                 mask_wearing_at: int, seed: int = None) -> None:
         """
         Constructor used for initializing the bound for the x axis, y axis,
         the k and R value for the particular population.
@@ -38,20 +38,30 @@ class PopulationUtil(object):
             Disease reproduction (R0) rate for the virus
         k : float
             The k value for the virus
+        seed : int, optional
+            Seed making the whole simulation reproducible, a fresh one is
+            used if not given.
         """
-        self.population = Population(size)
+        # Derive independent seeds for every random generator of the
+        # simulation from the one seed
+        seeds = np.random.SeedSequence(seed).generate_state(4)
+        self.rng = np.random.default_rng(seeds[0])
+        self.population = Population(size, seed=seeds[1])
         self.virus = Virus(infection_range, recovery_time,
-                           total_healthcare_capacity)
+                           total_healthcare_capacity, seed=seeds[2])
         self.recovery_time = recovery_time
         self.total_healthcare_capacity = total_healthcare_capacity
-        self.movement = Movement()
+        self.movement = Movement(seed=seeds[3])
         self.size = size
         self.x_bounds = [0, 1]
         self.y_bounds = [0, 1]
+        # Per person bounds checked by Movement.out_of_bounds() every frame
+        self._xbounds = np.array([self.x_bounds] * self.size)
+        self._ybounds = np.array([self.y_bounds] * self.size)
         self.k = k
         self.r = r
-        self.destinations = np.random.uniform(low=0, high=1,
-                                              size=(self.size, 2))
+        self.destinations = self.rng.uniform(low=0, high=1,
+                                             size=(self.size, 2))
         self.min_age = min_age
         self.max_age = max_age
         self.mortality_rate = mortality_rate
@@ -90,7 +100,7 @@ class PopulationUtil(object):
         self.persons = self.movement.update_persons(self.persons, self.size,
                                                     self.speed, 1)
 
-        self.infected_person = np.random.randint(0, self.size)
+        self.infected_person = self.rng.integers(0, self.size)
         self.persons[self.infected_person, index.g_value] = 3
         self.population.set_infected_at(self.infected_person, 0)
         self.persons[self.infected_person, index.infected_by] = \
@@ -120,11 +130,9 @@ class PopulationUtil(object):
             self.population \
                 .initialize_social_distancing(self.social_distance_per)
 
-        _xbounds = np.array([[0, 1]] * self.size)
-        _ybounds = np.array([[0, 1]] * self.size)
-
-        self.persons = self.movement.out_of_bounds(self.persons, _xbounds,
-                                                   _ybounds)
+        self.persons = self.movement.out_of_bounds(self.persons,
+                                                   self._xbounds,
+                                                   self._ybounds)
         self.persons = self.movement.update_persons(self.persons, self.size,
                                                     self.speed)
 
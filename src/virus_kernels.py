@@ -0,0 +1,86 @@
+'''
+Compiled kernels used by the virus simulation.
+
+Created on Oct 14, 2026
+'''
+import numpy as np
+from numba import njit
+import src.person_properties_util as index
+
+
+@njit(cache=True, fastmath=True)
+def infect_kernel(persons: np.ndarray, infected_idx: np.ndarray,
+                  rng: np.random.Generator, grid_order: np.ndarray,
+                  grid_cell_start: np.ndarray,
+                  grid_cell: np.ndarray, grid_width: int,
+                  infection_range: float, frame: int,
+                  free_beds: float) -> None:
+    """
+    Spreads the virus from every infected person to the healthy people
+    around them in a single pass over the population grid. The persons
+    array is updated in place.
+
+    Parameters
+    ----------
+    persons : np.ndarray
+        The NumPy array containing the details of the population.
+    infected_idx : np.ndarray
+        Index of the persons spreading the virus in this frame.
+    rng : np.random.Generator
+        Random generator deciding who gets infected.
+    grid_order : np.ndarray
+        Index of the persons ordered by their grid cell.
+    grid_cell_start : np.ndarray
+        Offset of every grid cell in grid_order.
+    grid_cell : np.ndarray
+        Grid cell of every person.
+    grid_width : int
+        Number of grid cells along one axis.
+    infection_range : float
+        Squared distance within which the virus can spread.
+    frame : int
+        The current frame, stored as the time of infection.
+    free_beds : float
+        Hospital capacity left before this frame.
+    """
+    for i in range(len(infected_idx)):
+        infector = infected_idx[i]
+
+        # The number of people this person can still infect, kept in a local
+        # and written back once after their neighbourhood has been visited.
+        g_value = persons[infector, index.g_value]
+        if g_value <= 0:
+            continue
+
+        x = persons[infector, index.x_axis]
+        y = persons[infector, index.y_axis]
+        cell_x = grid_cell[infector] % grid_width
+        cell_y = grid_cell[infector] // grid_width
+        left = max(cell_x - 1, 0)
+        right = min(cell_x + 1, grid_width - 1)
+
+        for row in range(max(cell_y - 1, 0), min(cell_y + 2, grid_width)):
+            for k in range(grid_cell_start[row * grid_width + left],
+                           grid_cell_start[row * grid_width + right + 1]):
+                j = grid_order[k]
+                dx = persons[j, index.x_axis] - x
+                dy = persons[j, index.y_axis] - y
+                if dx * dx + dy * dy >= infection_range or \
+                        persons[j, index.current_state] != 0 or \
+                        persons[j, index.social_distance] != 0:
+                    continue
+                if rng.uniform(0.0001, 1) < \
+                        persons[j, index.susceptibility]:
+                    persons[j, index.current_state] = 1
+                    persons[j, index.infected_by] = infector
+                    persons[j, index.infected_at] = frame
+                    g_value -= 1
+                    if free_beds > 0:
+                        persons[j, index.hospitalized] = 1
+                        free_beds -= 1
+                    if g_value <= 0:
+                        break
+            if g_value <= 0:
+                break
+
+        persons[infector, index.g_value] = g_value
@@ -4,8 +4,8 @@ Created on Nov 29, 2020
 '''
 from src.population import Population
 import numpy as np
-import math
 import src.person_properties_util as index
+from src.virus_kernels import infect_kernel
 
 
 class Virus():
@@ -15,14 +15,24 @@ class Virus():
     """
 
     def __init__(self, infection_range: float, recovery_time: int,
-                 total_healthcare_capacity: int) -> None:
+                 total_healthcare_capacity: int, seed: int = None) -> None:
         """
         The constructor is responsible for loading the virus statistics from
         the config file.
+
+        Parameters
+        ----------
+        seed : int, optional
+            Seed for the random generator deciding infections and deaths, a
+            fresh one is used if not given.
         """
+        # The infection range is the squared distance within which the
+        # virus spreads, so the radius is only derived once here.
         self.infection_range = infection_range
+        self.infection_radius = np.sqrt(infection_range)
         self.recovery_time = recovery_time
         self.total_healthcare_capacity = total_healthcare_capacity
+        self.rng = np.random.default_rng(seed)
 
     def infect(self, population: Population, frame: int) -> Population:
         """
@@ -42,69 +52,29 @@ class Virus():
         """
         # Get the index of all the people who were infected in the previous
         # step.
-        infected_idx = population.get_all_infected()
+        infected_idx = population.get_infected_idx()
         persons = population.get_person()
 
-        infected_counter = 0
-        for idx in infected_idx:
-            infected_counter += 1
-            if population.get_time_infected(int(idx[0]), frame) >= \
-                    self.recovery_time:
-                population = self.die_or_immune(population, int(idx[0]))
-
-            x_bounds = [persons[int(idx[0])][index.x_axis] -
-                        math.sqrt(self.infection_range),
-                        persons[int(idx[0])][index.x_axis] +
-                        math.sqrt(self.infection_range)]
-            y_bounds = [persons[int(idx[0])][index.y_axis] -
-                        math.sqrt(self.infection_range),
-                        persons[int(idx[0])][index.y_axis] +
-                        math.sqrt(self.infection_range)]
-
-            tmp = self.find_nearby(persons, x_bounds, y_bounds)
-            for i in tmp:
-                chance = np.random.uniform(low=0.0001, high=1)
-                if chance < persons[int(i)][index.susceptibility] and \
-                        persons[int(idx[0])][index.g_value] > 0:
-                    population.persons[int(i)][9] = 1
-                    population.persons[int(i)][index.infected_by] = idx[0]
-                    population.set_infected_at(int(i), frame)
-                    population.persons[int(idx[0])][index.g_value] -= 1
-                    if(len(population.persons[population
-                           .persons[:, index.hospitalized] == 1]) <
-                       self.total_healthcare_capacity):
-                        population.persons[int(i)][index.hospitalized] = 1
+        recovering = infected_idx[frame -
+                                  persons[infected_idx, index.infected_at] >=
+                                  self.recovery_time]
+        for idx in recovering:
+            population = self.die_or_immune(population, idx)
+
+        if len(infected_idx) == 0:
+            return population
+
+        # Bucket the population into grid cells as wide as the infection
+        # radius, so only the neighbouring cells can hold anyone in range.
+        population.rebuild_grid(self.infection_radius)
+        free_beds = self.total_healthcare_capacity - \
+            np.count_nonzero(persons[:, index.hospitalized] == 1)
+        infect_kernel(persons, infected_idx, self.rng, population.grid_order,
+                      population.grid_cell_start, population.grid_cell,
+                      population.grid_width, self.infection_range, frame,
+                      free_beds)
         return population
 
-    def find_nearby(self, persons: np.ndarray, x_bounds: list,
-                    y_bounds: list) -> list:
-        """
-        Find people nearby in a given x and y bound
-
-        Parameters
-        ----------
-        person : np.ndarray
-            Numpy array containing the population details
-        x_bounds : list
-            X bounds to look for other people in
-        y_bounds : list
-            Y bounds to look for other people in
-
-        Returns
-        -------
-        list
-            List of nearby people
-        """
-
-        rows = persons[:, 0][(x_bounds[0] < persons[:, index.x_axis]) &
-                             (x_bounds[1] > persons[:, index.x_axis]) &
-                             (y_bounds[0] < persons[:, index.y_axis]) &
-                             (y_bounds[1] > persons[:, index.y_axis]) &
-                             (persons[:, index.current_state] == 0) &
-                             (persons[:, index.current_state] == 0) &
-                             (persons[:, index.social_distance] == 0)]
-        return rows
-
     def die_or_immune(self, population: Population,
                       infected_person_idx: int) -> Population:
         """
@@ -123,22 +93,18 @@ class Virus():
         bool
             Population object updated with the mortality decision
         """
-        chance = np.random.uniform(low=0.001, high=1)
-        if population.persons[infected_person_idx][index.hospitalized] == 1:
-            population.persons[infected_person_idx][index.hospitalized] = 3
-            if(chance < population.persons[infected_person_idx]
-                                          [index.mortality_rate]):
-                population.persons[infected_person_idx][index.current_state] \
-                    = 3
+        chance = self.rng.uniform(low=0.001, high=1)
+        # A view of the person's row, so updates go to the population
+        person = population.persons[infected_person_idx]
+        if person[index.hospitalized] == 1:
+            person[index.hospitalized] = 3
+            if chance < person[index.mortality_rate]:
+                person[index.current_state] = 3
             else:
-                population.persons[infected_person_idx][index.current_state] \
-                    = 2
+                person[index.current_state] = 2
         else:
-            if (chance < population.persons[infected_person_idx]
-                                           [index.mortality_rate]) + 0.2:
-                population.persons[infected_person_idx][index.current_state] \
-                    = 3
+            if (chance < person[index.mortality_rate]) + 0.2:
+                person[index.current_state] = 3
             else:
-                population.persons[infected_person_idx][index.current_state] \
-                    = 2
+                person[index.current_state] = 2
         return population
@@ -269,22 +269,18 @@ class Visualization():
 
             # Get all the healthy, immune, infected, and dead people
             # seperately
-            healthy_x = self.putil.population \
-                .get_all_healthy()[:, index.x_axis]
-            healthy_y = self.putil.population \
-                .get_all_healthy()[:, index.y_axis]
-            infected_x = self.putil.population \
-                .get_all_infected()[:, index.x_axis]
-            infected_y = self.putil.population \
-                .get_all_infected()[:, index.y_axis]
-            immune_x = self.putil.population \
-                .get_all_recovered()[:, index.x_axis]
-            immune_y = self.putil.population \
-                .get_all_recovered()[:, index.y_axis]
-            dead_x = self.putil.population \
-                .get_all_dead()[:, index.x_axis]
-            dead_y = self.putil.population \
-                .get_all_dead()[:, index.y_axis]
+            healthy = self.putil.population.get_all_healthy()
+            infected = self.putil.population.get_all_infected()
+            immune = self.putil.population.get_all_recovered()
+            dead = self.putil.population.get_all_dead()
+            healthy_x = healthy[:, index.x_axis]
+            healthy_y = healthy[:, index.y_axis]
+            infected_x = infected[:, index.x_axis]
+            infected_y = infected[:, index.y_axis]
+            immune_x = immune[:, index.x_axis]
+            immune_y = immune[:, index.y_axis]
+            dead_x = dead[:, index.x_axis]
+            dead_y = dead[:, index.y_axis]
             total_infected = self.putil.size - len(healthy_x)
             currently_infected = len(infected_x)
 
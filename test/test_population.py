@@ -65,6 +65,45 @@ class PopulationClassTest(unittest.TestCase):
         assert isinstance(self.population.get_person(), np.ndarray)
         self.assertEqual(self.size, self.population.get_person()[:, 0].size)
 
+    def test_columns_contiguous(self):
+        """
+        Test to check if each property column of the population is laid out contiguously in memory
+        """
+        persons = self.population.get_person()
+        self.assertTrue(persons[:, 2].flags['C_CONTIGUOUS'])
+        self.assertTrue(persons[:, 9].flags['C_CONTIGUOUS'])
+
+    def test_initialize_susceptibility(self):
+        """
+        Test to check if initialize_susceptibility() lowers the chance of getting infected according to the mask each person wears
+        """
+        self.initialize()
+        persons = self.population.get_person()
+        np.testing.assert_allclose(persons[:, 13], 0.06 * (100 - persons[:, 15]) / 100)
+
+        self.population.set_mask_effectiveness(np.full(self.size, 90.0))
+        self.population.initialize_susceptibility()
+        np.testing.assert_allclose(persons[:, 13], 0.006, rtol=1e-6)
+
+    def test_seed(self):
+        """
+        Test to check if two populations created with the same seed are initialized identically
+        """
+        first = Population(self.size, seed=42)
+        second = Population(self.size, seed=42)
+        first.initialize_positions(self.x_bounds, self.y_bounds, self.size)
+        second.initialize_positions(self.x_bounds, self.y_bounds, self.size)
+        np.testing.assert_array_equal(first.get_person(), second.get_person())
+
+    def test_set_current_state(self):
+        """
+        Test to check if set_current_state() and set_at_destination() update their own columns only
+        """
+        self.population.set_current_state(np.ones(self.size))
+        self.population.set_at_destination(np.zeros(self.size))
+        self.assertTrue((self.population.get_current_state() == 1).all())
+        self.assertEqual(len(self.population.get_all_infected()), self.size)
+
     def test_get_all_infected(self):
         """
         Test to check if people returned by get_all_infected() are within the infection range of the infected person and are actually infected
@@ -74,6 +113,15 @@ class PopulationClassTest(unittest.TestCase):
         # Test if get_all_infected returns indices of all people infected
         self.assertEqual(persons[persons[:, 9] == 1].size, self.population.get_all_infected().size)
 
+    def test_get_infected_idx(self):
+        """
+        Test to check if get_infected_idx() returns the index of exactly the infected people
+        """
+        persons = self.population.get_person()
+        persons[[1, 3], 9] = 1
+
+        self.assertListEqual(list(self.population.get_infected_idx()), [1, 3])
+
     def test_get_all_healthy(self):
         """
         Test to check if the people at indices returned by get_all_healthy() are returned correctly; only healthy people are returned
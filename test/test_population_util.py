@@ -9,6 +9,7 @@ import unittest
 from src.config_util import ConfigUtil
 from src.population_util import PopulationUtil
 import functools
+import numpy as np
 
 
 class PopulationUtilClassTest(unittest.TestCase):
@@ -36,11 +37,11 @@ class PopulationUtilClassTest(unittest.TestCase):
         self.enforce_mask_wearing_at    = self.config_util.getIntegerValue("area.stats", "enforce_mask_wearing_at")
         self.initialize()
 
-    def initialize(self) -> None:
+    def initialize(self, seed: int = None) -> None:
         """
         Initializes the population util class with the appropriate parameters
         """
-        self.population_util = PopulationUtil(k=self.k, r=self.r, min_age=self.min_age, max_age=self.max_age,
+        self.population_util = PopulationUtil(seed=seed, k=self.k, r=self.r, min_age=self.min_age, max_age=self.max_age,
                                                   size=self.size,
                                                   mortality_rate=self.mortality_rate,
                                                   infection_range=self.infection_range,
@@ -73,4 +74,16 @@ class PopulationUtilClassTest(unittest.TestCase):
                 self.assertTrue(True, "Test passed, y axis values changed")
         except Exception as e:
             self.assertTrue(False, 'Test failed')
-            logging.error('Error occured '+e)
\ No newline at end of file
+            logging.error('Error occured '+e)
+
+    def test_seed(self):
+        """
+        Tests if two simulations created with the same seed move and infect the population identically
+        """
+        runs = []
+        for _ in range(2):
+            self.initialize(seed=7)
+            for frame in range(50):
+                self.population_util.move(frame)
+            runs.append(self.population_util.population.get_person())
+        np.testing.assert_array_equal(runs[0], runs[1])
@@ -104,3 +104,62 @@ class VirusUtilTest(unittest.TestCase):
         self.population.persons[:, index.mortality_rate] = 1.00
         self.virus_util.die_or_immune(self.population, int(self.population.get_all_infected()[0][0]))
         self.assertNotEqual(len(self.population.get_all_dead()), 0)
+
+    def test_infect_g_value(self):
+        """
+        Test to check if an infected person infects no more people than their g value allows and the g value is used up accordingly
+        """
+        self.population.set_x_axis(0.5)
+        self.population.set_y_axis(0.5)
+        self.population.persons[:, index.susceptibility] = 2
+        self.population.persons[0, index.current_state] = 1
+        self.population.persons[0, index.g_value] = 2
+
+        self.population = self.virus_util.infect(self.population, 1)
+
+        self.assertEqual(len(self.population.get_infected_idx()), 3)
+        self.assertEqual(self.population.persons[0, index.g_value], 0)
+        infected_by = self.population.persons[self.population.get_infected_idx()[1:], index.infected_by]
+        self.assertListEqual(list(infected_by), [0, 0])
+
+    def test_infect_tiny_range(self):
+        """
+        Test to check if infect() still works with an infection range that is tiny or zero, infecting only people at the exact same spot
+        """
+        for infection_range in [1e-9, 0.0]:
+            population = Population(100)
+            population.initialize_id(0, 100)
+            population.initialize_positions(self.x_bounds, self.y_bounds, 100)
+            population.persons[[0, 1], index.x_axis] = 0.5
+            population.persons[[0, 1], index.y_axis] = 0.5
+            population.persons[:, index.susceptibility] = 2
+            population.persons[0, index.current_state] = 1
+            population.persons[0, index.g_value] = 5
+
+            virus = Virus(infection_range, self.recovery_time, self.total_healthcare_capacity)
+            population = virus.infect(population, 1)
+
+            self.assertLessEqual(population.grid_width, 10)
+            expected = [0, 1] if infection_range > 0 else [0]
+            self.assertListEqual(list(population.get_infected_idx()), expected)
+
+    def test_infect_grid_window(self):
+        """
+        Test to check if infect() reaches people in range in the neighbouring grid cells, diagonals included, and nobody out of range
+        """
+        population = Population(100)
+        population.initialize_id(0, 100)
+        population.set_x_axis(0.05)
+        population.set_y_axis(0.05)
+        # Infected person, a person in the next cell, one in a diagonal cell,
+        # and one out of range in a diagonal cell
+        population.persons[:4, index.x_axis] = [0.55, 0.62, 0.49, 0.45]
+        population.persons[:4, index.y_axis] = [0.55, 0.55, 0.61, 0.48]
+        population.persons[:, index.susceptibility] = 2
+        population.persons[0, index.current_state] = 1
+        population.persons[0, index.g_value] = 5
+
+        virus = Virus(0.01, self.recovery_time, self.total_healthcare_capacity)
+        population = virus.infect(population, 1)
+
+        self.assertListEqual(list(population.get_infected_idx()), [0, 1, 2])